@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
-from typing import TypedDict, TypeVar
+from typing import Any, TypedDict, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -14,7 +14,7 @@ from homeassistant.const import (
     CONF_USERNAME,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from huawei_solar import (
@@ -379,3 +379,22 @@ class HuaweiSolarEntity(Entity):
     """Huawei Solar Entity."""
 
     _attr_has_entity_name = True
+
+    _state_fingerprint: tuple[Any, ...] | None = None
+
+    @callback
+    def is_state_unchanged(self, *fingerprint: Any) -> bool:
+        """Return whether the fingerprint matches the one of the last write."""
+        return (self.available, *fingerprint) == self._state_fingerprint
+
+    @callback
+    def async_write_ha_state_if_changed(self, *fingerprint: Any) -> None:
+        """Write the state to HA, unless it is unchanged since the last write.
+
+        The fingerprint must capture everything the state and attributes are
+        derived from. Availability is always taken into account.
+        """
+        if self.is_state_unchanged(*fingerprint):
+            return
+        self._state_fingerprint = (self.available, *fingerprint)
+        self.async_write_ha_state()
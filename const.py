@@ -20,6 +20,8 @@ INVERTER_UPDATE_INTERVAL = timedelta(seconds=30)
 POWER_METER_UPDATE_INTERVAL = timedelta(seconds=30)
 ENERGY_STORAGE_UPDATE_INTERVAL = timedelta(seconds=30)
 UPDATE_TIMEOUT = timedelta(seconds=29)
+# registers that rarely change, like timestamps and rated values, are read less often
+SLOW_UPDATE_INTERVAL = timedelta(minutes=5)
 # configuration can only change when edited through FusionSolar web or app
 CONFIGURATION_UPDATE_INTERVAL = timedelta(minutes=15)
 CONFIGURATION_UPDATE_TIMEOUT = timedelta(minutes=1)
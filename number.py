@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 
 from homeassistant.components.number import (
@@ -49,7 +50,7 @@ class HuaweiSolarNumberEntityDescription(NumberEntityDescription):
             self.translation_key or self.key.replace("#", "_").lower(),
         )
 
-    @property
+    @cached_property
     def context(self):
         """Context used by DataUpdateCoordinator."""
 
@@ -58,7 +59,7 @@ class HuaweiSolarNumberEntityDescription(NumberEntityDescription):
             registers.append(self.dynamic_minimum_key)
         if self.dynamic_maximum_key:
             registers.append(self.dynamic_maximum_key)
-        return {"register_names": registers}
+        return {"register_names": tuple(registers)}
 
 
 INVERTER_NUMBER_DESCRIPTIONS: tuple[HuaweiSolarNumberEntityDescription, ...] = (
@@ -331,8 +332,9 @@ class HuaweiSolarNumberEntity(CoordinatorEntity, HuaweiSolarEntity, NumberEntity
         """Set a new value."""
         if await self.bridge.set(self.entity_description.key, int(value)):
             self._attr_native_value = int(value)
-
-        await self.coordinator.async_request_refresh()
+            self.coordinator.async_push_value(self.entity_description.key, int(value))
+        else:
+            await self.coordinator.async_request_refresh()
 
     @property
     def native_max_value(self) -> float:
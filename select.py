@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import cached_property
 import logging
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
@@ -54,14 +55,14 @@ class HuaweiSolarSelectEntityDescription(Generic[T], SelectEntityDescription):
             self.translation_key or self.key.replace("#", "_").lower(),
         )
 
-    @property
+    @cached_property
     def context(self):
         """Context used by DataUpdateCoordinator."""
         registers = [self.key]
         if self.is_available_key:
             registers.append(self.is_available_key)
 
-        return {"register_names": registers}
+        return {"register_names": tuple(registers)}
 
 
 ENERGY_STORAGE_SWITCH_DESCRIPTIONS: tuple[HuaweiSolarSelectEntityDescription, ...] = (
@@ -213,10 +214,12 @@ class HuaweiSolarSelectEntity(CoordinatorEntity, HuaweiSolarEntity, SelectEntity
 
     async def async_select_option(self, option) -> None:
         """Change the selected option."""
-        await self.bridge.set(self.entity_description.key, self._to_enum(option))
-        self._attr_current_option = option
-
-        await self.coordinator.async_request_refresh()
+        value = self._to_enum(option)
+        if await self.bridge.set(self.entity_description.key, value):
+            self._attr_current_option = option
+            self.coordinator.async_push_value(self.entity_description.key, value)
+        else:
+            await self.coordinator.async_request_refresh()
 
     @property
     def available(self) -> bool:
@@ -292,10 +295,9 @@ class StorageModeSelectEntity(CoordinatorEntity, HuaweiSolarEntity, SelectEntity
 
     async def async_select_option(self, option) -> None:
         """Change the selected option."""
-        await self.bridge.set(
-            rn.STORAGE_WORKING_MODE_SETTINGS,
-            getattr(rv.StorageWorkingModesC, option.upper()),
-        )
-        self._attr_current_option = option
-
-        await self.coordinator.async_request_refresh()
+        value = getattr(rv.StorageWorkingModesC, option.upper())
+        if await self.bridge.set(rn.STORAGE_WORKING_MODE_SETTINGS, value):
+            self._attr_current_option = option
+            self.coordinator.async_push_value(rn.STORAGE_WORKING_MODE_SETTINGS, value)
+        else:
+            await self.coordinator.async_request_refresh()
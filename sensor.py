@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, cast
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import cache
+from itertools import chain
+from operator import itemgetter
+import sys
+from types import MappingProxyType
+from typing import Any, ClassVar, Protocol
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -39,7 +45,7 @@ from huawei_solar.registers import (
 )
 
 from . import HuaweiSolarEntity, HuaweiSolarUpdateCoordinators
-from .const import DATA_UPDATE_COORDINATORS, DOMAIN
+from .const import DATA_UPDATE_COORDINATORS, DOMAIN, SLOW_UPDATE_INTERVAL
 from .update_coordinator import (
     HuaweiSolarOptimizerUpdateCoordinator,
     HuaweiSolarUpdateCoordinator,
@@ -47,231 +53,247 @@ from .update_coordinator import (
 
 PARALLEL_UPDATES = 1
 
+# Contexts are shared between all descriptions that read the same register
+_CONTEXT_CACHE: dict[tuple[str, timedelta | None], dict[str, Any]] = {}
 
-@dataclass(frozen=True)
-class HuaweiSolarSensorEntityDescription(SensorEntityDescription):
-    """Huawei Solar Sensor Entity."""
 
-    value_conversion_function: Callable[[Any], str] | None = None
+class _ValueConversionFunction(Protocol):
+    """Converts the value of a register into the state of a sensor."""
 
-    def __post_init__(self):
-        """Defaults the translation_key to the sensor key."""
+    def __call__(self, value: Any, /) -> str:
+        """Convert the value."""
 
-        # We use this special setter to be able to set/update the translation_key
-        # in this frozen dataclass.
-        # cfr. https://docs.python.org/3/library/dataclasses.html#frozen-instances
-        object.__setattr__(
-            self,
-            "translation_key",
-            self.translation_key or self.key.replace("#", "_").lower(),
-        )
 
-    @property
-    def context(self):
-        """Context used by DataUpdateCoordinator."""
-        return {"register_names": [self.key.split("#")[0]]}
+@cache
+def _default_translation_key(key: str) -> str:
+    return key.replace("#", "_").lower()
 
 
-# Every list in this file describes a group of entities which are related to each other.
-# The order of these lists matters, as they need to be in ascending order wrt. to their modbus-register.
+@dataclass(frozen=True)
+class HuaweiSolarSensorEntityDescription(SensorEntityDescription):
+    """Huawei Solar Sensor Entity."""
 
+    value_conversion_function: _ValueConversionFunction | None = None
+
+    # Read the register at most once per update_interval instead of on every
+    # update of the DataUpdateCoordinator
+    update_interval: timedelta | None = None
+
+    # Derived from the key by `.create`: 'STATE_2#1' is index 1 of register 'STATE_2'
+    register_name: str = field(kw_only=True, repr=False, compare=False)
+
+    # Context used by DataUpdateCoordinator. It never changes, so it is
+    # computed only once instead of every time the coordinator asks for it.
+    context: dict[str, Any] = field(kw_only=True, repr=False, compare=False)
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        key: str,
+        translation_key: str | None = None,
+        update_interval: timedelta | None = None,
+        **kwargs: Any,
+    ) -> HuaweiSolarSensorEntityDescription:
+        """Huawei Solar Sensor Entity Description constructor.
+
+        Defaults the translation_key to the sensor key, and derives the
+        register name and context from it. A key like 'STATE_2#1' selects
+        index 1 of the value of register 'STATE_2'.
+        """
+        register_name, _, sub_index = key.partition("#")
+        if sub_index:
+            kwargs.setdefault("value_conversion_function", itemgetter(int(sub_index)))
+        return cls(
+            key=key,
+            translation_key=translation_key or _default_translation_key(key),
+            register_name=register_name,
+            update_interval=update_interval,
+            context=_CONTEXT_CACHE.setdefault(
+                (register_name, update_interval),
+                {
+                    "register_names": (sys.intern(register_name),),
+                    "update_interval": update_interval,
+                },
+            ),
+            **kwargs,
+        )
 
-INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INPUT_POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_A_B,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_B_C,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.LINE_VOLTAGE_C_A,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_C_VOLTAGE,
+
+# Helpers for the most common kinds of sensors
+def _voltage(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_B_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.PHASE_C_CURRENT,
+        **kwargs,
+    )
+
+
+def _current(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.DAY_ACTIVE_POWER_PEAK,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_POWER,
+        **kwargs,
+    )
+
+
+def _power(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.REACTIVE_POWER,
+        **kwargs,
+    )
+
+
+def _reactive_power(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
         native_unit_of_measurement=POWER_VOLT_AMPERE_REACTIVE,
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
+        **kwargs,
+    )
+
+
+def _energy_total(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL,
+        **kwargs,
+    )
+
+
+def _energy_total_increasing(
+    key: str, **kwargs: Any
+) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        **kwargs,
+    )
+
+
+def _temperature(key: str, **kwargs: Any) -> HuaweiSolarSensorEntityDescription:
+    return HuaweiSolarSensorEntityDescription.create(
+        key=key,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        **kwargs,
+    )
+
+
+def _join_alarms(alarms: list[str], _join=", ".join) -> str:
+    # binding the join method as default argument avoids looking it up on every call
+    return _join(alarms) if alarms else "None"
+
+
+# Every list in this file describes a group of entities which are related to each other.
+# The order of these lists matters, as they need to be in ascending order wrt. to their modbus-register.
+
+
+INVERTER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
+    _power(rn.INPUT_POWER),
+    _voltage(rn.LINE_VOLTAGE_A_B, entity_registry_enabled_default=False),
+    _voltage(rn.LINE_VOLTAGE_B_C, entity_registry_enabled_default=False),
+    _voltage(rn.LINE_VOLTAGE_C_A, entity_registry_enabled_default=False),
+    _voltage(rn.PHASE_A_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.PHASE_B_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.PHASE_C_VOLTAGE, entity_registry_enabled_default=False),
+    _current(rn.PHASE_A_CURRENT, entity_registry_enabled_default=False),
+    _current(rn.PHASE_B_CURRENT, entity_registry_enabled_default=False),
+    _current(rn.PHASE_C_CURRENT, entity_registry_enabled_default=False),
+    _power(rn.DAY_ACTIVE_POWER_PEAK),
+    _power(rn.ACTIVE_POWER),
+    _reactive_power(rn.REACTIVE_POWER, entity_registry_enabled_default=False),
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.POWER_FACTOR,
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.EFFICIENCY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.INTERNAL_TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _temperature(rn.INTERNAL_TEMPERATURE, entity_registry_enabled_default=False),
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.INSULATION_RESISTANCE,
         icon="mdi:omega",
         native_unit_of_measurement="ohm",
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.DEVICE_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.STARTUP_TIME,
         icon="mdi:weather-sunset-up",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.SHUTDOWN_TIME,
         icon="mdi:weather-sunset-down",
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACCUMULATED_YIELD_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.TOTAL_DC_INPUT_POWER,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _energy_total(rn.ACCUMULATED_YIELD_ENERGY),
+    _energy_total(rn.TOTAL_DC_INPUT_POWER),
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.CURRENT_ELECTRICITY_GENERATION_STATISTICS_TIME,
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.HOURLY_YIELD_ENERGY,
-        icon="mdi:solar-power",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.DAILY_YIELD_ENERGY,
-        icon="mdi:solar-power",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _energy_total_increasing(rn.HOURLY_YIELD_ENERGY, icon="mdi:solar-power"),
+    _energy_total_increasing(rn.DAILY_YIELD_ENERGY, icon="mdi:solar-power"),
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.STATE_1,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_conversion_function=", ".join,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=f"{rn.STATE_2}#0",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[0],
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=f"{rn.STATE_2}#1",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[1],
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=f"{rn.STATE_2}#2",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[2],
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=f"{rn.STATE_3}#0",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[0],
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=f"{rn.STATE_3}#1",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda value: value[1],
     ),
 )
 
 OPTIMIZER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.NB_ONLINE_OPTIMIZERS,
         icon="mdi:solar-panel",
         state_class=SensorStateClass.MEASUREMENT,
@@ -279,135 +301,82 @@ OPTIMIZER_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] =
 )
 
 OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
-        key="output_power",
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="voltage_to_ground",
+    _power("output_power", icon="mdi:flash"),
+    _voltage(
+        "voltage_to_ground",
         icon="mdi:lightning-bolt",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key="output_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="output_current",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="input_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="input_current",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key="temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _voltage("output_voltage"),
+    _current("output_current"),
+    _voltage("input_voltage"),
+    _current("input_current"),
+    _temperature("temperature"),
+    HuaweiSolarSensorEntityDescription.create(
         key="running_status",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key="accumulated_energy_yield",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _energy_total("accumulated_energy_yield"),
+    HuaweiSolarSensorEntityDescription.create(
         key="alarm",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_conversion_function=lambda alarms: ", ".join(alarms)
-        if len(alarms)
-        else "None",
+        value_conversion_function=_join_alarms,
     ),
 )
 
 
+# These descriptions are identical for single- and three-phase power meters,
+# so they are only created once and shared between both tuples below.
+_POWER_METER_ENTITY_DESCRIPTIONS: dict[str, HuaweiSolarSensorEntityDescription] = {
+    description.key: description
+    for description in (
+        HuaweiSolarSensorEntityDescription.create(
+            key=rn.METER_STATUS,
+            icon="mdi:electric-switch",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        _current(rn.ACTIVE_GRID_A_CURRENT, entity_registry_enabled_default=False),
+        _power(rn.POWER_METER_ACTIVE_POWER, icon="mdi:flash"),
+        _reactive_power(
+            rn.POWER_METER_REACTIVE_POWER,
+            icon="mdi:flash",
+            entity_registry_enabled_default=False,
+        ),
+        HuaweiSolarSensorEntityDescription.create(
+            key=rn.ACTIVE_GRID_POWER_FACTOR,
+            device_class=SensorDeviceClass.POWER_FACTOR,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        _energy_total_increasing(rn.GRID_EXPORTED_ENERGY),
+        _energy_total_increasing(rn.GRID_ACCUMULATED_ENERGY),
+    )
+}
+
+
 SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
     HuaweiSolarSensorEntityDescription, ...
 ] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.METER_STATUS,
-        icon="mdi:electric-switch",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_A_VOLTAGE,
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.METER_STATUS],
+    _voltage(
+        rn.GRID_A_VOLTAGE,
         translation_key="single_phase_voltage",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_ACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_REACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=POWER_VOLT_AMPERE_REACTIVE,
-        device_class=SensorDeviceClass.REACTIVE_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_POWER_FACTOR,
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.ACTIVE_GRID_A_CURRENT],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.POWER_METER_ACTIVE_POWER],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.POWER_METER_REACTIVE_POWER],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.ACTIVE_GRID_POWER_FACTOR],
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.ACTIVE_GRID_FREQUENCY,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_EXPORTED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_ACCUMULATED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.GRID_EXPORTED_ENERGY],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.GRID_ACCUMULATED_ENERGY],
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.GRID_ACCUMULATED_REACTIVE_POWER,
         native_unit_of_measurement="kVarh",
         # Was SensorDeviceClass.REACTIVE_POWER, which only supports 'var' unit of measurement.
@@ -422,93 +391,25 @@ SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
 THREE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
     HuaweiSolarSensorEntityDescription, ...
 ] = (
-    HuaweiSolarSensorEntityDescription(
-        key=rn.METER_STATUS,
-        icon="mdi:electric-switch",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_C_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_CURRENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_ACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.POWER_METER_REACTIVE_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=POWER_VOLT_AMPERE_REACTIVE,
-        device_class=SensorDeviceClass.REACTIVE_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_POWER_FACTOR,
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.METER_STATUS],
+    _voltage(rn.GRID_A_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.GRID_B_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.GRID_C_VOLTAGE, entity_registry_enabled_default=False),
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.ACTIVE_GRID_A_CURRENT],
+    _current(rn.ACTIVE_GRID_B_CURRENT, entity_registry_enabled_default=False),
+    _current(rn.ACTIVE_GRID_C_CURRENT, entity_registry_enabled_default=False),
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.POWER_METER_ACTIVE_POWER],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.POWER_METER_REACTIVE_POWER],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.ACTIVE_GRID_POWER_FACTOR],
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.ACTIVE_GRID_FREQUENCY,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_EXPORTED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.GRID_ACCUMULATED_ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-    ),
-    HuaweiSolarSensorEntityDescription(
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.GRID_EXPORTED_ENERGY],
+    _POWER_METER_ENTITY_DESCRIPTIONS[rn.GRID_ACCUMULATED_ENERGY],
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.GRID_ACCUMULATED_REACTIVE_POWER,
         native_unit_of_measurement="kVarh",
         # Was SensorDeviceClass.REACTIVE_POWER, which only supports 'var' unit of measurement.
@@ -517,114 +418,40 @@ THREE_PHASE_METER_ENTITY_DESCRIPTIONS: tuple[
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_B_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_C_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_A_VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=False,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_A_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_B_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.ACTIVE_GRID_C_POWER,
-        icon="mdi:flash",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+    _voltage(rn.ACTIVE_GRID_A_B_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.ACTIVE_GRID_B_C_VOLTAGE, entity_registry_enabled_default=False),
+    _voltage(rn.ACTIVE_GRID_C_A_VOLTAGE, entity_registry_enabled_default=False),
+    _power(rn.ACTIVE_GRID_A_POWER, icon="mdi:flash"),
+    _power(rn.ACTIVE_GRID_B_POWER, icon="mdi:flash"),
+    _power(rn.ACTIVE_GRID_C_POWER, icon="mdi:flash"),
 )
 
 BATTERIES_SENSOR_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = (
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.STORAGE_STATE_OF_CAPACITY,
         icon="mdi:home-battery",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    HuaweiSolarSensorEntityDescription(
+    HuaweiSolarSensorEntityDescription.create(
         key=rn.STORAGE_RUNNING_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_BUS_VOLTAGE,
-        icon="mdi:home-lightning-bolt",
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_BUS_CURRENT,
-        icon="mdi:home-lightning-bolt-outline",
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CHARGE_DISCHARGE_POWER,
-        icon="mdi:home-battery-outline",
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.POWER,
+    _voltage(rn.STORAGE_BUS_VOLTAGE, icon="mdi:home-lightning-bolt"),
+    _current(rn.STORAGE_BUS_CURRENT, icon="mdi:home-lightning-bolt-outline"),
+    _power(rn.STORAGE_CHARGE_DISCHARGE_POWER, icon="mdi:home-battery-outline"),
+    _energy_total(rn.STORAGE_TOTAL_CHARGE, icon="mdi:battery-plus-variant"),
+    _energy_total(rn.STORAGE_TOTAL_DISCHARGE, icon="mdi:battery-minus-variant"),
+    _energy_total_increasing(
+        rn.STORAGE_CURRENT_DAY_CHARGE_CAPACITY, icon="mdi:battery-plus-variant"
     ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_TOTAL_CHARGE,
-        icon="mdi:battery-plus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        device_class=SensorDeviceClass.ENERGY,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_TOTAL_DISCHARGE,
-        icon="mdi:battery-minus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        device_class=SensorDeviceClass.ENERGY,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CURRENT_DAY_CHARGE_CAPACITY,
-        icon="mdi:battery-plus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        device_class=SensorDeviceClass.ENERGY,
-    ),
-    HuaweiSolarSensorEntityDescription(
-        key=rn.STORAGE_CURRENT_DAY_DISCHARGE_CAPACITY,
-        icon="mdi:battery-minus-variant",
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        device_class=SensorDeviceClass.ENERGY,
+    _energy_total_increasing(
+        rn.STORAGE_CURRENT_DAY_DISCHARGE_CAPACITY, icon="mdi:battery-minus-variant"
     ),
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatteryTemplateEntityDescription:
     """Template for Huawei Solar Battery Sensor Entity Description."""
 
@@ -637,6 +464,7 @@ class BatteryTemplateEntityDescription:
     native_unit_of_measurement: str | None = None
     icon: str | None = None
     entity_category: EntityCategory | None = None
+    update_interval: timedelta | None = None
 
 
 BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ...] = (
@@ -653,6 +481,7 @@ BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ..
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.ENERGY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
     BatteryTemplateEntityDescription(
         battery_1_key=rn.STORAGE_UNIT_1_RATED_DISCHARGE_POWER,
@@ -662,6 +491,7 @@ BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ..
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.ENERGY,
         entity_category=EntityCategory.DIAGNOSTIC,
+        update_interval=SLOW_UPDATE_INTERVAL,
     ),
     BatteryTemplateEntityDescription(
         battery_1_key=rn.STORAGE_UNIT_1_CURRENT_DAY_CHARGE_CAPACITY,
@@ -757,6 +587,36 @@ BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS: tuple[BatteryTemplateEntityDescription, ..
 )
 
 
+def _battery_entity_descriptions(
+    battery_unit: int,
+) -> tuple[HuaweiSolarSensorEntityDescription, ...]:
+    """Create the entity descriptions for battery unit 1 or 2."""
+    assert battery_unit in (1, 2)
+    descriptions = []
+    for template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS:
+        key = template.battery_1_key if battery_unit == 1 else template.battery_2_key
+        if key is None:
+            continue
+        descriptions.append(
+            HuaweiSolarSensorEntityDescription.create(
+                key=key,
+                translation_key=template.translation_key,
+                device_class=template.device_class,
+                state_class=template.state_class,
+                native_unit_of_measurement=template.native_unit_of_measurement,
+                icon=template.icon,
+                entity_category=template.entity_category,
+                update_interval=template.update_interval,
+                entity_registry_enabled_default=False,
+            )
+        )
+    return tuple(descriptions)
+
+
+_BATTERY_1_DESCRIPTIONS = _battery_entity_descriptions(1)
+_BATTERY_2_DESCRIPTIONS = _battery_entity_descriptions(2)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -767,166 +627,166 @@ async def async_setup_entry(
         entry.entry_id
     ][DATA_UPDATE_COORDINATORS]
 
-    entities_to_add: list[SensorEntity] = []
-    for ucs in update_coordinators:
-        entities_to_add.extend(
+    async_add_entities(
+        chain.from_iterable(_entities_for(ucs) for ucs in update_coordinators), True
+    )
+
+
+def _entities_for(ucs: HuaweiSolarUpdateCoordinators) -> Iterator[SensorEntity]:
+    """Lazily chain the sensor entities of all devices of one inverter."""
+    return chain(
+        _inverter_entities(ucs),
+        _power_meter_entities(ucs),
+        _battery_entities(ucs),
+        _optimizer_entities(ucs),
+    )
+
+
+def _inverter_entities(ucs: HuaweiSolarUpdateCoordinators) -> Iterator[SensorEntity]:
+    """Yield the sensor entities of the inverter itself."""
+    yield from (
+        HuaweiSolarSensorEntity(
+            ucs.inverter_update_coordinator,
+            entity_description,
+            ucs.device_infos["inverter"],
+        )
+        for entity_description in INVERTER_SENSOR_DESCRIPTIONS
+    )
+    yield HuaweiSolarAlarmSensorEntity(
+        ucs.inverter_update_coordinator, ucs.device_infos["inverter"]
+    )
+
+    yield from (
+        HuaweiSolarSensorEntity(
+            ucs.inverter_update_coordinator,
+            entity_description,
+            ucs.device_infos["inverter"],
+        )
+        for entity_description in get_pv_entity_descriptions(ucs.bridge.pv_string_count)
+    )
+
+    if ucs.bridge.has_optimizers:
+        yield from (
             HuaweiSolarSensorEntity(
                 ucs.inverter_update_coordinator,
                 entity_description,
                 ucs.device_infos["inverter"],
             )
-            for entity_description in INVERTER_SENSOR_DESCRIPTIONS
-        )
-        entities_to_add.append(
-            HuaweiSolarAlarmSensorEntity(
-                ucs.inverter_update_coordinator, ucs.device_infos["inverter"]
-            )
+            for entity_description in OPTIMIZER_SENSOR_DESCRIPTIONS
         )
 
-        entities_to_add.extend(
+
+def _power_meter_entities(
+    ucs: HuaweiSolarUpdateCoordinators,
+) -> Iterator[SensorEntity]:
+    """Yield the sensor entities of the connected power meter, if any."""
+    if ucs.bridge.power_meter_type == rv.MeterType.SINGLE_PHASE:
+        assert ucs.power_meter_update_coordinator
+        assert ucs.device_infos["power_meter"]
+        yield from (
             HuaweiSolarSensorEntity(
-                ucs.inverter_update_coordinator,
+                ucs.power_meter_update_coordinator,
                 entity_description,
-                ucs.device_infos["inverter"],
-            )
-            for entity_description in get_pv_entity_descriptions(
-                ucs.bridge.pv_string_count
+                ucs.device_infos["power_meter"],
             )
+            for entity_description in SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS
         )
 
-        if ucs.bridge.has_optimizers:
-            entities_to_add.extend(
-                HuaweiSolarSensorEntity(
-                    ucs.inverter_update_coordinator,
-                    entity_description,
-                    ucs.device_infos["inverter"],
-                )
-                for entity_description in OPTIMIZER_SENSOR_DESCRIPTIONS
+    elif ucs.bridge.power_meter_type == rv.MeterType.THREE_PHASE:
+        assert ucs.power_meter_update_coordinator
+        assert ucs.device_infos["power_meter"]
+        yield from (
+            HuaweiSolarSensorEntity(
+                ucs.power_meter_update_coordinator,
+                entity_description,
+                ucs.device_infos["power_meter"],
             )
+            for entity_description in THREE_PHASE_METER_ENTITY_DESCRIPTIONS
+        )
 
-        if ucs.bridge.power_meter_type == rv.MeterType.SINGLE_PHASE:
-            assert ucs.power_meter_update_coordinator
-            assert ucs.device_infos["power_meter"]
-            entities_to_add.extend(
-                HuaweiSolarSensorEntity(
-                    ucs.power_meter_update_coordinator,
-                    entity_description,
-                    ucs.device_infos["power_meter"],
-                )
-                for entity_description in SINGLE_PHASE_METER_ENTITY_DESCRIPTIONS
-            )
 
-        elif ucs.bridge.power_meter_type == rv.MeterType.THREE_PHASE:
-            assert ucs.power_meter_update_coordinator
-            assert ucs.device_infos["power_meter"]
-            entities_to_add.extend(
-                HuaweiSolarSensorEntity(
-                    ucs.power_meter_update_coordinator,
-                    entity_description,
-                    ucs.device_infos["power_meter"],
-                )
-                for entity_description in THREE_PHASE_METER_ENTITY_DESCRIPTIONS
-            )
+def _battery_entities(ucs: HuaweiSolarUpdateCoordinators) -> Iterator[SensorEntity]:
+    """Yield the sensor entities of the connected batteries, if any."""
+    if ucs.bridge.battery_type == rv.StorageProductModel.NONE:
+        return
 
-        if ucs.bridge.battery_type != rv.StorageProductModel.NONE:
-            assert ucs.energy_storage_update_coordinator
-            assert ucs.device_infos["connected_energy_storage"]
+    assert ucs.energy_storage_update_coordinator
+    assert ucs.device_infos["connected_energy_storage"]
 
-            entities_to_add.extend(
-                HuaweiSolarSensorEntity(
-                    ucs.energy_storage_update_coordinator,
-                    entity_description,
-                    ucs.device_infos["connected_energy_storage"],
-                )
-                for entity_description in BATTERIES_SENSOR_DESCRIPTIONS
-            )
+    yield from (
+        HuaweiSolarSensorEntity(
+            ucs.energy_storage_update_coordinator,
+            entity_description,
+            ucs.device_infos["connected_energy_storage"],
+        )
+        for entity_description in BATTERIES_SENSOR_DESCRIPTIONS
+    )
 
-            if ucs.configuration_update_coordinator:
-                entities_to_add.extend(
-                    [
-                        HuaweiSolarTOUPricePeriodsSensorEntity(
-                            ucs.configuration_update_coordinator,
-                            ucs.bridge,
-                            ucs.device_infos["connected_energy_storage"],
-                        ),
-                        HuaweiSolarFixedChargingPeriodsSensorEntity(
-                            ucs.configuration_update_coordinator,
-                            ucs.configuration_update_coordinator.bridge,
-                            ucs.device_infos["connected_energy_storage"],
-                        ),
-                        HuaweiSolarForcibleChargeEntity(
-                            ucs.configuration_update_coordinator,
-                            ucs.configuration_update_coordinator.bridge,
-                            ucs.device_infos["connected_energy_storage"],
-                        ),
-                    ]
-                )
+    if ucs.configuration_update_coordinator:
+        yield HuaweiSolarTOUPricePeriodsSensorEntity(
+            ucs.configuration_update_coordinator,
+            ucs.bridge,
+            ucs.device_infos["connected_energy_storage"],
+        )
+        yield HuaweiSolarFixedChargingPeriodsSensorEntity(
+            ucs.configuration_update_coordinator,
+            ucs.configuration_update_coordinator.bridge,
+            ucs.device_infos["connected_energy_storage"],
+        )
+        yield HuaweiSolarForcibleChargeEntity(
+            ucs.configuration_update_coordinator,
+            ucs.configuration_update_coordinator.bridge,
+            ucs.device_infos["connected_energy_storage"],
+        )
 
-                if ucs.bridge.supports_capacity_control:
-                    entities_to_add.append(
-                        HuaweiSolarCapacityControlPeriodsSensorEntity(
-                            ucs.configuration_update_coordinator,
-                            ucs.configuration_update_coordinator.bridge,
-                            ucs.device_infos["connected_energy_storage"],
-                        )
-                    )
-
-            if ucs.device_infos["battery_1"]:
-                entities_to_add.extend(
-                    HuaweiSolarSensorEntity(
-                        ucs.energy_storage_update_coordinator,
-                        HuaweiSolarSensorEntityDescription(
-                            key=entity_description_template.battery_1_key,
-                            translation_key=entity_description_template.translation_key,
-                            device_class=entity_description_template.device_class,
-                            state_class=entity_description_template.state_class,
-                            native_unit_of_measurement=entity_description_template.native_unit_of_measurement,
-                            icon=entity_description_template.icon,
-                            entity_category=entity_description_template.entity_category,
-                            entity_registry_enabled_default=False,
-                        ),
-                        ucs.device_infos["battery_1"],
-                    )
-                    for entity_description_template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS
-                    if entity_description_template.battery_1_key
-                )
+        if ucs.bridge.supports_capacity_control:
+            yield HuaweiSolarCapacityControlPeriodsSensorEntity(
+                ucs.configuration_update_coordinator,
+                ucs.configuration_update_coordinator.bridge,
+                ucs.device_infos["connected_energy_storage"],
+            )
 
-            if ucs.device_infos["battery_2"]:
-                entities_to_add.extend(
-                    HuaweiSolarSensorEntity(
-                        ucs.energy_storage_update_coordinator,
-                        HuaweiSolarSensorEntityDescription(
-                            key=entity_description_template.battery_2_key,
-                            translation_key=entity_description_template.translation_key,
-                            device_class=entity_description_template.device_class,
-                            state_class=entity_description_template.state_class,
-                            native_unit_of_measurement=entity_description_template.native_unit_of_measurement,
-                            icon=entity_description_template.icon,
-                            entity_category=entity_description_template.entity_category,
-                            entity_registry_enabled_default=False,
-                        ),
-                        ucs.device_infos["battery_2"],
-                    )
-                    for entity_description_template in BATTERY_TEMPLATE_SENSOR_DESCRIPTIONS
-                    if entity_description_template.battery_2_key
-                )
-        if ucs.optimizer_update_coordinator:
-            optimizer_device_infos = (
-                ucs.optimizer_update_coordinator.optimizer_device_infos
+    if ucs.device_infos["battery_1"]:
+        yield from (
+            HuaweiSolarSensorEntity(
+                ucs.energy_storage_update_coordinator,
+                entity_description,
+                ucs.device_infos["battery_1"],
             )
+            for entity_description in _BATTERY_1_DESCRIPTIONS
+        )
 
-            entities_to_add.extend(
-                HuaweiSolarOptimizerSensorEntity(
-                    ucs.optimizer_update_coordinator,
-                    entity_description,
-                    optimizer_id,
-                    device_info,
-                )
-                for optimizer_id, device_info in optimizer_device_infos.items()
-                for entity_description in OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS
+    if ucs.device_infos["battery_2"]:
+        yield from (
+            HuaweiSolarSensorEntity(
+                ucs.energy_storage_update_coordinator,
+                entity_description,
+                ucs.device_infos["battery_2"],
             )
+            for entity_description in _BATTERY_2_DESCRIPTIONS
+        )
+
 
-    async_add_entities(entities_to_add, True)
+def _optimizer_entities(
+    ucs: HuaweiSolarUpdateCoordinators,
+) -> Iterator[SensorEntity]:
+    """Yield the sensor entities of the individual optimizers, if any."""
+    if not ucs.optimizer_update_coordinator:
+        return
+
+    coordinator = ucs.optimizer_update_coordinator
+    entity_descriptions = OPTIMIZER_DETAIL_SENSOR_DESCRIPTIONS
+
+    yield from (
+        HuaweiSolarOptimizerSensorEntity(
+            coordinator,
+            entity_description,
+            optimizer_id,
+            device_info,
+        )
+        for optimizer_id, device_info in coordinator.optimizer_device_infos.items()
+        for entity_description in entity_descriptions
+    )
 
 
 class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity):
@@ -950,18 +810,19 @@ class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity
         self._attr_device_info = device_info
         self._attr_unique_id = f"{coordinator.bridge.serial_number}_{description.key}"
 
-        self._register_key = self.entity_description.key
-        if "#" in self._register_key:
-            self._register_key = self._register_key[0 : self._register_key.find("#")]
+        self._register_key = description.register_name
+        self._value_conversion_function = description.value_conversion_function
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and self._register_key in self.coordinator.data:
-            value = self.coordinator.data[self._register_key].value
+        data = self.coordinator.data
+        result = data.get(self._register_key) if data else None
+        if result is not None:
+            value = result.value
 
-            if self.entity_description.value_conversion_function:
-                value = self.entity_description.value_conversion_function(value)
+            if self._value_conversion_function:
+                value = self._value_conversion_function(value)
 
             self._attr_native_value = value
             self._attr_available = True
@@ -969,7 +830,9 @@ class HuaweiSolarSensorEntity(CoordinatorEntity, HuaweiSolarEntity, SensorEntity
             self._attr_available = False
             self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(
+            self._attr_available, self._attr_native_value
+        )
 
 
 class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
@@ -979,8 +842,11 @@ class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
     """
 
     ALARM_REGISTERS = [rn.ALARM_1, rn.ALARM_2, rn.ALARM_3]
+    _CONTEXT: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {"register_names": tuple(ALARM_REGISTERS)}
+    )
 
-    DESCRIPTION = HuaweiSolarSensorEntityDescription(
+    DESCRIPTION = HuaweiSolarSensorEntityDescription.create(
         key="ALARMS",
         translation_key="alarms",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -996,7 +862,7 @@ class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
             coordinator,
             HuaweiSolarAlarmSensorEntity.DESCRIPTION,
             device_info,
-            {"register_names": HuaweiSolarAlarmSensorEntity.ALARM_REGISTERS},
+            HuaweiSolarAlarmSensorEntity._CONTEXT,
         )
 
     @callback
@@ -1004,37 +870,45 @@ class HuaweiSolarAlarmSensorEntity(HuaweiSolarSensorEntity):
         """Handle updated data from the coordinator."""
         available = False
 
-        if self.coordinator.data:
+        data = self.coordinator.data
+        if data:
             alarms: list[rv.Alarm] = []
-            for alarm_register in HuaweiSolarAlarmSensorEntity.ALARM_REGISTERS:
-                alarm_register = self.coordinator.data.get(alarm_register)
-                if alarm_register:
+            for register_name in self.ALARM_REGISTERS:
+                result = data.get(register_name)
+                if result:
                     available = True
-                    alarms.extend(alarm_register.value)
+                    alarms.extend(result.value)
             if len(alarms) == 0:
                 self._attr_native_value = "None"
             else:
                 self._attr_native_value = ", ".join(
-                    [f"[{alarm.level}] {alarm.id}: {alarm.name}" for alarm in alarms]
+                    f"[{alarm.level}] {alarm.id}: {alarm.name}" for alarm in alarms
                 )
         else:
             self._attr_native_value = None
 
         self._attr_available = available
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(
+            self._attr_available, self._attr_native_value
+        )
 
 
-def _days_effective_to_str(days: tuple[bool, bool, bool, bool, bool, bool, bool]):
-    value = ""
-    for i in range(7):  # Sunday is on index 0, but we want to name it day 7
-        if days[(i + 1) % 7]:
-            value += f"{i+1}"
+# Sunday is on index 0, but we want to name it day 7
+_DAY_CHARS = "1234567"
+_DAY_INDICES = (1, 2, 3, 4, 5, 6, 0)
 
-    return value
+
+def _days_effective_to_str(days: tuple[bool, bool, bool, bool, bool, bool, bool]):
+    return "".join(
+        day_char
+        for day_char, day_index in zip(_DAY_CHARS, _DAY_INDICES)
+        if days[day_index]
+    )
 
 
 def _time_int_to_str(time):
-    return f"{time//60:02d}:{time%60:02d}"
+    hours, minutes = divmod(time, 60)
+    return f"{hours:02d}:{minutes:02d}"
 
 
 class HuaweiSolarTOUPricePeriodsSensorEntity(
@@ -1046,6 +920,10 @@ class HuaweiSolarTOUPricePeriodsSensorEntity(
     contents of them as extended attributes
     """
 
+    _CONTEXT: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {"register_names": (rn.STORAGE_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS,)}
+    )
+
     def __init__(
         self,
         coordinator: HuaweiSolarUpdateCoordinator,
@@ -1053,24 +931,24 @@ class HuaweiSolarTOUPricePeriodsSensorEntity(
         device_info: DeviceInfo,
     ) -> None:
         """Huawei Solar TOU Sensor Entity constructor."""
-        super().__init__(
-            coordinator,
-            {
-                "register_names": [
-                    rn.STORAGE_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS
-                ]
-            },
-        )
+        super().__init__(coordinator, self._CONTEXT)
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
+        self.entity_description = HuaweiSolarSensorEntityDescription.create(
             key=rn.STORAGE_TIME_OF_USE_CHARGING_AND_DISCHARGING_PERIODS,
             icon="mdi:calendar-text",
         )
 
-        self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+        # The period type only depends on the battery model, which is fixed
+        self._period_to_text: Callable[[Any], str] = (
+            self._lg_resu_period_to_text
+            if bridge.battery_type == rv.StorageProductModel.LG_RESU
+            else self._huawei_luna2000_period_to_text
+        )
 
     def _lg_resu_period_to_text(self, period: LG_RESU_TimeOfUsePeriod):
         return (
@@ -1088,37 +966,30 @@ class HuaweiSolarTOUPricePeriodsSensorEntity(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and self.entity_description.key in self.coordinator.data
-        ):
+        data = self.coordinator.data
+        result = data.get(self.entity_description.key) if data else None
+        # the state and attributes are derived from the periods only
+        if self.is_state_unchanged(result):
+            return
+
+        if result is not None:
             self._attr_available = True
 
-            data: (
+            periods: (
                 list[LG_RESU_TimeOfUsePeriod] | list[HUAWEI_LUNA2000_TimeOfUsePeriod]
-            ) = self.coordinator.data[self.entity_description.key].value
-
-            self._attr_native_value = len(data)
-
-            if len(data) == 0:
-                self._attr_extra_state_attributes.clear()
-            elif isinstance(data[0], LG_RESU_TimeOfUsePeriod):
-                self._attr_extra_state_attributes = {
-                    f"Period {idx+1}": self._lg_resu_period_to_text(
-                        cast(LG_RESU_TimeOfUsePeriod, period)
-                    )
-                    for idx, period in enumerate(data)
-                }
-            elif isinstance(data[0], HUAWEI_LUNA2000_TimeOfUsePeriod):
-                self._attr_extra_state_attributes = {
-                    f"Period {idx+1}": self._huawei_luna2000_period_to_text(period)
-                    for idx, period in enumerate(data)
-                }
+            ) = result.value
+
+            self._attr_native_value = len(periods)
+            self._attr_extra_state_attributes = {
+                f"Period {idx}": self._period_to_text(period)
+                for idx, period in enumerate(periods, start=1)
+            }
         else:
             self._attr_available = False
             self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(result)
 
 
 class HuaweiSolarCapacityControlPeriodsSensorEntity(
@@ -1130,6 +1001,10 @@ class HuaweiSolarCapacityControlPeriodsSensorEntity(
     contents of them as extended attributes
     """
 
+    _CONTEXT: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {"register_names": (rn.STORAGE_CAPACITY_CONTROL_PERIODS,)}
+    )
+
     def __init__(
         self,
         coordinator: HuaweiSolarUpdateCoordinator,
@@ -1137,19 +1012,17 @@ class HuaweiSolarCapacityControlPeriodsSensorEntity(
         device_info: DeviceInfo,
     ) -> None:
         """Huawei Solar Capacity Control Periods Sensor Entity constructor."""
-        super().__init__(
-            coordinator, {"register_names": [rn.STORAGE_CAPACITY_CONTROL_PERIODS]}
-        )
+        super().__init__(coordinator, self._CONTEXT)
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
+        self.entity_description = HuaweiSolarSensorEntityDescription.create(
             key=rn.STORAGE_CAPACITY_CONTROL_PERIODS,
             icon="mdi:calendar-text",
         )
 
-        self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
+        self._attr_extra_state_attributes: dict[str, Any] = {}
 
     def _period_to_text(self, psp: PeakSettingPeriod):
         return (
@@ -1162,26 +1035,27 @@ class HuaweiSolarCapacityControlPeriodsSensorEntity(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and self.entity_description.key in self.coordinator.data
-        ):
-            data: list[PeakSettingPeriod] = self.coordinator.data[
-                self.entity_description.key
-            ].value
+        data = self.coordinator.data
+        result = data.get(self.entity_description.key) if data else None
+        # the state and attributes are derived from the periods only
+        if self.is_state_unchanged(result):
+            return
+
+        if result is not None:
+            periods: list[PeakSettingPeriod] = result.value
 
             self._attr_available = True
-            self._attr_native_value = len(data)
+            self._attr_native_value = len(periods)
             self._attr_extra_state_attributes = {
-                f"Period {idx+1}": self._period_to_text(period)
-                for idx, period in enumerate(data)
+                f"Period {idx}": self._period_to_text(period)
+                for idx, period in enumerate(periods, start=1)
             }
         else:
             self._attr_available = False
             self._attr_native_value = None
-            self._attr_extra_state_attributes.clear()
+            self._attr_extra_state_attributes = {}
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(result)
 
 
 class HuaweiSolarFixedChargingPeriodsSensorEntity(
@@ -1193,6 +1067,10 @@ class HuaweiSolarFixedChargingPeriodsSensorEntity(
     contents of them as extended attributes
     """
 
+    _CONTEXT: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {"register_names": (rn.STORAGE_FIXED_CHARGING_AND_DISCHARGING_PERIODS,)}
+    )
+
     def __init__(
         self,
         coordinator: HuaweiSolarUpdateCoordinator,
@@ -1200,20 +1078,17 @@ class HuaweiSolarFixedChargingPeriodsSensorEntity(
         device_info: DeviceInfo,
     ) -> None:
         """Huawei Solar Capacity Control Periods Sensor Entity constructor."""
-        super().__init__(
-            coordinator,
-            {"register_names": [rn.STORAGE_FIXED_CHARGING_AND_DISCHARGING_PERIODS]},
-        )
+        super().__init__(coordinator, self._CONTEXT)
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
+        self.entity_description = HuaweiSolarSensorEntityDescription.create(
             key=rn.STORAGE_FIXED_CHARGING_AND_DISCHARGING_PERIODS,
             icon="mdi:calendar-text",
         )
 
-        self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
+        self._attr_extra_state_attributes: dict[str, Any] = {}
 
     def _period_to_text(self, cdp: ChargeDischargePeriod):
         return (
@@ -1225,25 +1100,27 @@ class HuaweiSolarFixedChargingPeriodsSensorEntity(
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and self.entity_description.key in self.coordinator.data
-        ):
-            data: list[ChargeDischargePeriod] = self.coordinator.data[
-                self.entity_description.key
-            ].value
+        data = self.coordinator.data
+        result = data.get(self.entity_description.key) if data else None
+        # the state and attributes are derived from the periods only
+        if self.is_state_unchanged(result):
+            return
+
+        if result is not None:
+            periods: list[ChargeDischargePeriod] = result.value
 
             self._attr_available = True
-            self._attr_native_value = len(data)
+            self._attr_native_value = len(periods)
             self._attr_extra_state_attributes = {
-                f"Period {idx+1}": self._period_to_text(period)
-                for idx, period in enumerate(data)
+                f"Period {idx}": self._period_to_text(period)
+                for idx, period in enumerate(periods, start=1)
             }
         else:
             self._attr_available = False
             self._attr_native_value = None
-            self._attr_extra_state_attributes.clear()
-        self.async_write_ha_state()
+            self._attr_extra_state_attributes = {}
+
+        self.async_write_ha_state_if_changed(result)
 
 
 class HuaweiSolarForcibleChargeEntity(
@@ -1259,6 +1136,38 @@ class HuaweiSolarForcibleChargeEntity(
         rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD,
         rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC,
     ]
+    _REGISTER_NAMES_SET: ClassVar[frozenset[str]] = frozenset(REGISTER_NAMES)
+    _CONTEXT: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {"register_names": tuple(REGISTER_NAMES)}
+    )
+
+    # summary formats by (mode, setting), filled in from the state attributes
+    _SUMMARY_FORMATS: ClassVar[dict[tuple[int, int], str]] = {
+        (
+            rv.StorageForcibleChargeDischarge.STOP,
+            rv.StorageForcibleChargeDischargeTargetMode.TIME,
+        ): "Stopped",
+        (
+            rv.StorageForcibleChargeDischarge.STOP,
+            rv.StorageForcibleChargeDischargeTargetMode.SOC,
+        ): "Stopped",
+        (
+            rv.StorageForcibleChargeDischarge.CHARGE,
+            rv.StorageForcibleChargeDischargeTargetMode.TIME,
+        ): "Charging at {charge_power}W for {duration} minutes",
+        (
+            rv.StorageForcibleChargeDischarge.CHARGE,
+            rv.StorageForcibleChargeDischargeTargetMode.SOC,
+        ): "Charging at {charge_power}W until {target_soc}%",
+        (
+            rv.StorageForcibleChargeDischarge.DISCHARGE,
+            rv.StorageForcibleChargeDischargeTargetMode.TIME,
+        ): "Discharging at {discharge_power}W for {duration} minutes",
+        (
+            rv.StorageForcibleChargeDischarge.DISCHARGE,
+            rv.StorageForcibleChargeDischargeTargetMode.SOC,
+        ): "Discharging at {discharge_power}W until {target_soc}%",
+    }
 
     def __init__(
         self,
@@ -1267,63 +1176,32 @@ class HuaweiSolarForcibleChargeEntity(
         device_info: DeviceInfo,
     ) -> None:
         """Create HuaweiSolarForcibleChargeEntity."""
-        super().__init__(
-            coordinator,
-            {"register_names": self.REGISTER_NAMES},
-        )
+        super().__init__(coordinator, self._CONTEXT)
         self.coordinator = coordinator
 
-        self.entity_description = HuaweiSolarSensorEntityDescription(
+        self.entity_description = HuaweiSolarSensorEntityDescription.create(
             key=rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
             icon="mdi:battery-charging-medium",
             translation_key="forcible_charge_summary",
         )
 
-        self._bridge = bridge
         self._attr_device_info = device_info
         self._attr_unique_id = f"{bridge.serial_number}_{self.entity_description.key}"
+        self._attr_extra_state_attributes: dict[str, Any] = {}
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.coordinator.data
-            and set(self.REGISTER_NAMES) <= self.coordinator.data.keys()
-        ):
-            mode = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE
-            ].value
-            setting = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE
-            ].value
-            charge_power = self.coordinator.data[rn.STORAGE_FORCIBLE_CHARGE_POWER].value
-            discharge_power = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_DISCHARGE_POWER
-            ].value
-            target_soc = self.coordinator.data[
-                rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC
-            ].value
-            duration = self.coordinator.data[
-                rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD
-            ].value
-
-            if mode == rv.StorageForcibleChargeDischarge.STOP:
-                value = "Stopped"
-            elif mode == rv.StorageForcibleChargeDischarge.CHARGE:
-                if setting == rv.StorageForcibleChargeDischargeTargetMode.SOC:
-                    value = f"Charging at {charge_power}W until {target_soc}%"
-                else:
-                    value = f"Charging at {charge_power}W for {duration} minutes"
-            else:
-                assert mode == rv.StorageForcibleChargeDischarge.DISCHARGE
-                if setting == rv.StorageForcibleChargeDischargeTargetMode.SOC:
-                    value = f"Discharging at {discharge_power}W until {target_soc}%"
-                else:
-                    value = f"Discharging at {discharge_power}W for {duration} minutes"
-
-            self._attr_available = True
-            self._attr_native_value = value
-            self._attr_extra_state_attributes = {
+        data = self.coordinator.data
+        if data and self._REGISTER_NAMES_SET <= data.keys():
+            mode = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE].value
+            setting = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE].value
+            charge_power = data[rn.STORAGE_FORCIBLE_CHARGE_POWER].value
+            discharge_power = data[rn.STORAGE_FORCIBLE_DISCHARGE_POWER].value
+            target_soc = data[rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC].value
+            duration = data[rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD].value
+
+            attributes = {
                 "mode": str(mode),
                 "setting": str(setting),
                 "charge_power": charge_power,
@@ -1331,11 +1209,28 @@ class HuaweiSolarForcibleChargeEntity(
                 "target_soc": target_soc,
                 "duration": duration,
             }
+
+            self._attr_available = True
+            self._attr_native_value = self._SUMMARY_FORMATS[(mode, setting)].format_map(
+                attributes
+            )
+            self._attr_extra_state_attributes = attributes
+            fingerprint: tuple[Any, ...] | None = (
+                mode,
+                setting,
+                charge_power,
+                discharge_power,
+                target_soc,
+                duration,
+            )
         else:
+            fingerprint = None
             self._attr_available = False
             self._attr_native_value = None
-            self._attr_extra_state_attributes.clear()
-        self.async_write_ha_state()
+            self._attr_extra_state_attributes = {}
+
+        # the state and attributes are derived from the register values only
+        self.async_write_ha_state_if_changed(self._attr_available, fingerprint)
 
 
 class HuaweiSolarOptimizerSensorEntity(
@@ -1359,59 +1254,57 @@ class HuaweiSolarOptimizerSensorEntity(
         self.entity_description = description
         self.optimizer_id = optimizer_id
 
+        self._value_conversion_function = description.value_conversion_function
+
         self._attr_device_info = device_info
         self._attr_unique_id = f"{device_info['name']}_{description.key}"
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        optimizer_data = self.coordinator.data.get(self.optimizer_id)
         self._attr_available = (
-            self.optimizer_id in self.coordinator.data
+            optimizer_data is not None
             # Optimizer data fields only return sensible data when the
             # optimizer is not offline
             and (
                 self.entity_description.key == "running_status"
-                or self.coordinator.data[self.optimizer_id].running_status
-                != OptimizerRunningStatus.OFFLINE
+                or optimizer_data.running_status != OptimizerRunningStatus.OFFLINE
             )
         )
 
-        if self.optimizer_id in self.coordinator.data:
-            value = getattr(
-                self.coordinator.data[self.optimizer_id], self.entity_description.key
-            )
-            if self.entity_description.value_conversion_function:
-                value = self.entity_description.value_conversion_function(value)
+        if optimizer_data is not None:
+            value = getattr(optimizer_data, self.entity_description.key)
+            if self._value_conversion_function:
+                value = self._value_conversion_function(value)
 
             self._attr_native_value = value
 
         else:
             self._attr_native_value = None
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(
+            self._attr_available, self._attr_native_value
+        )
 
 
-def get_pv_entity_descriptions(count: int) -> list[HuaweiSolarSensorEntityDescription]:
-    """Create the entity descriptions for a PV string."""
-    assert 1 <= count <= 24
-    result = []
-
-    for idx in range(1, count + 1):
-        result.extend(
-            [
-                HuaweiSolarSensorEntityDescription(
-                    key=getattr(rn, f"PV_{idx:02}_VOLTAGE"),
-                    native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-                    device_class=SensorDeviceClass.VOLTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                ),
-                HuaweiSolarSensorEntityDescription(
-                    key=getattr(rn, f"PV_{idx:02}_CURRENT"),
-                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                    device_class=SensorDeviceClass.CURRENT,
-                    state_class=SensorStateClass.MEASUREMENT,
-                ),
-            ]
-        )
+_PV_STRING_ENTITY_DESCRIPTIONS: tuple[HuaweiSolarSensorEntityDescription, ...] = tuple(
+    description
+    for idx in range(1, 25)
+    for description in (
+        _voltage(getattr(rn, f"PV_{idx:02}_VOLTAGE")),
+        _current(getattr(rn, f"PV_{idx:02}_CURRENT")),
+    )
+)
+
 
-    return result
+def get_pv_entity_descriptions(
+    count: int,
+) -> tuple[HuaweiSolarSensorEntityDescription, ...]:
+    """Create the entity descriptions for a PV string.
+
+    The descriptions for all 24 possible PV strings are built once at import,
+    this only returns the ones for the first `count` strings.
+    """
+    assert 1 <= count <= 24
+    return _PV_STRING_ENTITY_DESCRIPTIONS[: 2 * count]
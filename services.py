@@ -271,6 +271,32 @@ async def _validate_power_value(power: Any, bridge: HuaweiSolarBridge, max_value
     return power
 
 
+async def _set_registers(
+    bridge: HuaweiSolarBridge,
+    uc: HuaweiSolarUpdateCoordinator,
+    values: dict[str, Any],
+) -> None:
+    """Write the number registers in the given order and update the coordinator.
+
+    When all writes succeed, the written values are pushed to the coordinator,
+    which saves a full read of the device. The coordinator stores them as a read
+    would decode them, e.g. a target SoC of 80 as 80.0. Otherwise the coordinator
+    is refreshed.
+
+    The period registers are not written with this: their values can change when
+    they are encoded, so those services refresh the coordinator after writing.
+    """
+    success = True
+    for register_name, value in values.items():
+        if not await bridge.set(register_name, value):
+            success = False
+
+    if success:
+        uc.async_push_values(values)
+    else:
+        await uc.async_refresh()
+
+
 async def forcible_charge(hass: HomeAssistant, service_call: ServiceCall) -> None:
     """Start a forcible charge on the battery."""
     bridge, uc = get_battery_bridge(hass, service_call)
@@ -282,22 +308,21 @@ async def forcible_charge(hass: HomeAssistant, service_call: ServiceCall) -> Non
     if duration > 1440:
         raise ValueError("Maximum duration is 1440 minutes")
 
-    await bridge.set(rn.STORAGE_FORCIBLE_CHARGE_POWER, power)
-    await bridge.set(
-        rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD,
-        duration,
-    )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,
-        rv.StorageForcibleChargeDischargeTargetMode.TIME,
-    )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-        rv.StorageForcibleChargeDischarge.CHARGE,
+    await _set_registers(
+        bridge,
+        uc,
+        {
+            rn.STORAGE_FORCIBLE_CHARGE_POWER: power,
+            rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD: duration,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE: (
+                rv.StorageForcibleChargeDischargeTargetMode.TIME
+            ),
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE: (
+                rv.StorageForcibleChargeDischarge.CHARGE
+            ),
+        },
     )
 
-    await uc.async_refresh()
-
 
 async def forcible_discharge(hass: HomeAssistant, service_call: ServiceCall) -> None:
     """Start a forcible charge on the battery."""
@@ -310,20 +335,20 @@ async def forcible_discharge(hass: HomeAssistant, service_call: ServiceCall) ->
     if duration > 1440:
         raise ValueError("Maximum duration is 1440 minutes")
 
-    await bridge.set(rn.STORAGE_FORCIBLE_DISCHARGE_POWER, power)
-    await bridge.set(
-        rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD,
-        duration,
+    await _set_registers(
+        bridge,
+        uc,
+        {
+            rn.STORAGE_FORCIBLE_DISCHARGE_POWER: power,
+            rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD: duration,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE: (
+                rv.StorageForcibleChargeDischargeTargetMode.TIME
+            ),
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE: (
+                rv.StorageForcibleChargeDischarge.DISCHARGE
+            ),
+        },
     )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,
-        rv.StorageForcibleChargeDischargeTargetMode.TIME,
-    )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-        rv.StorageForcibleChargeDischarge.DISCHARGE,
-    )
-    await uc.async_refresh()
 
 
 async def forcible_charge_soc(hass: HomeAssistant, service_call: ServiceCall) -> None:
@@ -334,18 +359,20 @@ async def forcible_charge_soc(hass: HomeAssistant, service_call: ServiceCall) ->
         service_call.data[DATA_POWER], bridge, rn.STORAGE_MAXIMUM_CHARGE_POWER
     )
 
-    await bridge.set(rn.STORAGE_FORCIBLE_CHARGE_POWER, power)
-    await bridge.set(rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC, target_soc)
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,
-        rv.StorageForcibleChargeDischargeTargetMode.SOC,
+    await _set_registers(
+        bridge,
+        uc,
+        {
+            rn.STORAGE_FORCIBLE_CHARGE_POWER: power,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC: target_soc,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE: (
+                rv.StorageForcibleChargeDischargeTargetMode.SOC
+            ),
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE: (
+                rv.StorageForcibleChargeDischarge.CHARGE
+            ),
+        },
     )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-        rv.StorageForcibleChargeDischarge.CHARGE,
-    )
-
-    await uc.async_refresh()
 
 
 async def forcible_discharge_soc(
@@ -358,38 +385,40 @@ async def forcible_discharge_soc(
         service_call.data[DATA_POWER], bridge, rn.STORAGE_MAXIMUM_DISCHARGE_POWER
     )
 
-    await bridge.set(rn.STORAGE_FORCIBLE_DISCHARGE_POWER, power)
-    await bridge.set(rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC, target_soc)
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,
-        rv.StorageForcibleChargeDischargeTargetMode.SOC,
+    await _set_registers(
+        bridge,
+        uc,
+        {
+            rn.STORAGE_FORCIBLE_DISCHARGE_POWER: power,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SOC: target_soc,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE: (
+                rv.StorageForcibleChargeDischargeTargetMode.SOC
+            ),
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE: (
+                rv.StorageForcibleChargeDischarge.DISCHARGE
+            ),
+        },
     )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-        rv.StorageForcibleChargeDischarge.DISCHARGE,
-    )
-    await uc.async_refresh()
 
 
 async def stop_forcible_charge(hass: HomeAssistant, service_call: ServiceCall) -> None:
     """Stop a forcible charge or discharge."""
     bridge, uc = get_battery_bridge(hass, service_call)
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE,
-        rv.StorageForcibleChargeDischarge.STOP,
-    )
-    await bridge.set(rn.STORAGE_FORCIBLE_DISCHARGE_POWER, 0)
-    await bridge.set(
-        rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD,
-        0,
-    )
-    await bridge.set(
-        rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE,
-        rv.StorageForcibleChargeDischargeTargetMode.TIME,
+    await _set_registers(
+        bridge,
+        uc,
+        {
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_WRITE: (
+                rv.StorageForcibleChargeDischarge.STOP
+            ),
+            rn.STORAGE_FORCIBLE_DISCHARGE_POWER: 0,
+            rn.STORAGE_FORCED_CHARGING_AND_DISCHARGING_PERIOD: 0,
+            rn.STORAGE_FORCIBLE_CHARGE_DISCHARGE_SETTING_MODE: (
+                rv.StorageForcibleChargeDischargeTargetMode.TIME
+            ),
+        },
     )
 
-    await uc.async_refresh()
-
 
 async def reset_maximum_feed_grid_power(
     hass: HomeAssistant, service_call: ServiceCall
@@ -560,7 +589,7 @@ async def set_capacity_control_periods(
             )
         return result
 
-    bridge = get_battery_bridge(hass, service_call)
+    bridge, uc = get_battery_bridge(hass, service_call)
 
     if not re.fullmatch(
         CAPACITY_CONTROL_PERIODS_PATTERN, service_call.data[DATA_PERIODS]
@@ -572,6 +601,8 @@ async def set_capacity_control_periods(
         _parse_periods(service_call.data[DATA_PERIODS]),
     )
 
+    await uc.async_refresh()
+
 
 async def set_fixed_charge_periods(
     hass: HomeAssistant, service_call: ServiceCall
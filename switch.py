@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
@@ -48,14 +49,14 @@ class HuaweiSolarSwitchEntityDescription(Generic[T], SwitchEntityDescription):
             self.translation_key or self.key.replace("#", "_").lower(),
         )
 
-    @property
+    @cached_property
     def context(self):
         """Context used by DataUpdateCoordinator."""
         registers = [self.key]
         if self.is_available_key:
             registers.append(self.is_available_key)
 
-        return {"register_names": registers}
+        return {"register_names": tuple(registers)}
 
 
 ENERGY_STORAGE_SWITCH_DESCRIPTIONS: tuple[HuaweiSolarSwitchEntityDescription, ...] = (
@@ -184,15 +185,17 @@ class HuaweiSolarSwitchEntity(CoordinatorEntity, HuaweiSolarEntity, SwitchEntity
         """Turn the setting on."""
         if await self.bridge.set(self.entity_description.key, True):
             self._attr_is_on = True
-
-        await self.coordinator.async_request_refresh()
+            self.coordinator.async_push_value(self.entity_description.key, True)
+        else:
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the setting off."""
         if await self.bridge.set(self.entity_description.key, False):
             self._attr_is_on = False
-
-        await self.coordinator.async_request_refresh()
+            self.coordinator.async_push_value(self.entity_description.key, False)
+        else:
+            await self.coordinator.async_request_refresh()
 
     @property
     def available(self) -> bool:
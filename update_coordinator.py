@@ -1,4 +1,9 @@
-"""Specialized DataUpdateCoordinators for Huawei Solar entities."""
+"""Specialized DataUpdateCoordinators for Huawei Solar entities.
+
+Entities that write a register should push the written value into their
+coordinator with `async_push_value`, instead of requesting a refresh which
+reads all registers of that coordinator again.
+"""
 
 from __future__ import annotations
 
@@ -7,19 +12,45 @@ from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from itertools import chain
 import logging
+import math
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from huawei_solar import HuaweiSolarBridge, HuaweiSolarException
+from huawei_solar.registers import REGISTERS, NumberRegister
 
 from .const import OPTIMIZER_UPDATE_TIMEOUT, UPDATE_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _is_pushable(register_name: str) -> bool:
+    """Return whether a written value can be converted into its decoded form.
+
+    This is only known for number registers, which includes the bool and enum
+    registers. Other registers, like the TOU or capacity control periods, can
+    lose precision or drop entries when they are encoded.
+    """
+    return isinstance(REGISTERS.get(register_name), NumberRegister)
+
+
+def _as_decoded(register_name: str, value: Any) -> Any:
+    """Return the value of a number register as it will be decoded when read back.
+
+    Registers with a gain are written as int(value * gain) and read back as
+    a float divided by that gain. Only valid for registers that are pushable.
+    """
+    register = REGISTERS[register_name]
+    assert isinstance(register, NumberRegister)
+    if register.gain != 1:
+        return int(value * register.gain) / register.gain
+    return value
+
+
 class HuaweiSolarUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """A specialised DataUpdateCoordinator for Huawei Solar entities."""
 
@@ -48,18 +79,116 @@ class HuaweiSolarUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.bridge = bridge
         self.update_timeout = update_timeout
 
-    async def _async_update_data(self):
-        register_names_set = set(
-            chain.from_iterable(ctx["register_names"] for ctx in self.async_contexts())
+        # monotonic timestamp of the last read of registers with their own update interval
+        self._last_read: dict[str, float] = {}
+
+        # (register names, update interval in seconds of slow registers), derived
+        # from the listener contexts. Reset whenever a listener is added or removed.
+        self._register_names: tuple[frozenset[str], dict[str, float]] | None = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates."""
+        self._register_names = None
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        @callback
+        def _remove_listener() -> None:
+            self._register_names = None
+            remove_listener()
+
+        return _remove_listener
+
+    def _compute_register_names(self) -> tuple[frozenset[str], dict[str, float]]:
+        contexts = list(self.async_contexts())
+        register_names = frozenset(
+            chain.from_iterable(
+                ctx["register_names"]
+                for ctx in contexts
+                if ctx.get("update_interval") is None
+            )
         )
+
+        slow_register_names: dict[str, float] = {}
+        for ctx in contexts:
+            if (update_interval := ctx.get("update_interval")) is None:
+                continue
+            for register_name in ctx["register_names"]:
+                if register_name not in register_names:
+                    slow_register_names[register_name] = min(
+                        update_interval.total_seconds(),
+                        slow_register_names.get(register_name, math.inf),
+                    )
+
+        return register_names, slow_register_names
+
+    async def _async_update_data(self):
+        if self._register_names is None:
+            self._register_names = self._compute_register_names()
+        register_names, slow_register_names = self._register_names
+
+        # Registers with their own (longer) update interval are only read
+        # again when their last value has become too old.
+        now = time.monotonic()
+        cached_data: dict[str, Any] = {}
+        slow_register_names_to_read: list[str] = []
+        for register_name, update_interval in slow_register_names.items():
+            if (
+                self.data
+                and register_name in self.data
+                and now - self._last_read.get(register_name, -math.inf)
+                < update_interval
+            ):
+                cached_data[register_name] = self.data[register_name]
+            else:
+                slow_register_names_to_read.append(register_name)
+
         try:
             async with asyncio.timeout(self.update_timeout.total_seconds()):
-                return await self.bridge.batch_update(list(register_names_set))
+                data = await self.bridge.batch_update(
+                    [*register_names, *slow_register_names_to_read]
+                )
         except HuaweiSolarException as err:
             raise UpdateFailed(
                 f"Could not update {self.bridge.serial_number} values: {err}"
             ) from err
 
+        for register_name in slow_register_names_to_read:
+            self._last_read[register_name] = now
+
+        return cached_data | data
+
+    @callback
+    def async_push_value(self, register_name: str, value: Any) -> None:
+        """Update the value of a register that was successfully written to the device."""
+        self.async_push_values({register_name: value})
+
+    @callback
+    def async_push_values(self, values: dict[str, Any]) -> None:
+        """Update the values of registers that were successfully written to the device.
+
+        The listeners are only notified once, regardless of the number of registers.
+        The values are stored as a read would decode them, so that the entity state
+        does not change again at the next poll. When that is not possible for one
+        of the registers, a refresh is requested instead.
+        """
+        if not self.data or self.data.keys().isdisjoint(values):
+            return  # no entity is interested in these registers
+
+        if not all(map(_is_pushable, values)):
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        data = dict(self.data)
+        for register_name, value in values.items():
+            if register_name in data:
+                data[register_name] = data[register_name]._replace(
+                    value=_as_decoded(register_name, value)
+                )
+        self.async_set_updated_data(data)
+
 
 class HuaweiSolarOptimizerUpdateCoordinator(DataUpdateCoordinator):
     """A specialised DataUpdateCoordinator for Huawei Solar optimizers."""